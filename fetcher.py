@@ -1,40 +1,380 @@
 #!/usr/bin/env python3
 
 import argparse
+import calendar
+import functools
 import json
-from datetime import datetime
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
 
 import requests
-from dateutil.relativedelta import relativedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional, falls back to the stdlib json module
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:  # Optional, archive responses are then never cached
+    requests_cache = None
+
+# Connect/read timeouts (seconds) for every API call
+REQUEST_TIMEOUT = (3.05, 30)
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "open-meteo-analyzer")
+
+# HTTP cache for archive responses (only used when requests-cache is installed)
+HTTP_CACHE_PATH = os.path.join(CACHE_DIR, "http")
+HTTP_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Shared session so the geocoding and archive hosts keep a warm
+# TCP/TLS connection across calls during a run; built on first use so
+# importing the module or running --help never opens the HTTP cache
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+_use_http_cache = requests_cache is not None
+
+
+def _session():
+    """Return the shared HTTP session, creating it on the first call."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = _build_session()
+        return _SESSION
+
+
+def _build_session():
+    """Create the HTTP session, cached on disk when requests-cache is enabled."""
+    if _use_http_cache:
+        session = requests_cache.CachedSession(
+            HTTP_CACHE_PATH,
+            backend="sqlite",
+            allowable_methods=("GET",),
+            # Geocoding has its own cache, so only archive responses are stored
+            urls_expire_after={
+                "archive-api.open-meteo.com": HTTP_CACHE_TTL,
+                "*": requests_cache.DO_NOT_CACHE,
+            },
+        )
+    else:
+        session = requests.Session()
+    # Transient gateway errors are retried with backoff on the same pool
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+            ),
+        ),
+    )
+    return session
+
+
+def _decode_json(response):
+    """Decode a JSON response body, using orjson when available.
+
+    Both paths parse the raw bytes (Open-Meteo always sends UTF-8), which
+    skips the charset detection `response.json()` would run.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+def disable_http_cache():
+    """Bypass the HTTP response cache for the rest of the run, if there is one."""
+    global _use_http_cache
+    with _SESSION_LOCK:
+        _use_http_cache = False
+        # A session built earlier keeps its cache file but stops using it
+        if requests_cache is not None and _SESSION is not None:
+            _SESSION.settings.disabled = True
+
+
+# On-disk geocoding cache, keyed by normalized place name
+GEOCODE_CACHE_PATH = os.path.join(CACHE_DIR, "geocode.json")
+GEOCODE_CACHE_TTL = 24 * 60 * 60  # seconds
+_GEOCODE_CACHE_LOCK = threading.Lock()
+
+# Upper bounds on concurrent geocoding and archive requests
+MAX_GEOCODING_WORKERS = 8
+MAX_ARCHIVE_WORKERS = 4
+
+
+@functools.lru_cache(maxsize=None)
+def _load_geocode_cache():
+    """Load the geocoding cache once per run (empty if missing or corrupt)."""
+    try:
+        raw = Path(GEOCODE_CACHE_PATH).read_bytes()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_geocode_cache(cache):
+    """Write the geocoding cache atomically so a crash never leaves it truncated."""
+    os.makedirs(os.path.dirname(GEOCODE_CACHE_PATH), exist_ok=True)
+    _write_json(GEOCODE_CACHE_PATH, cache)
+
+
+def invalidate_geocode_cache(place_name=None):
+    """Drop one place (or, with no argument, every place) from the geocoding cache."""
+    with _GEOCODE_CACHE_LOCK:
+        cache = _load_geocode_cache()
+        if place_name is None:
+            cache.clear()
+        else:
+            cache.pop(place_name.strip().lower(), None)
+        try:
+            _save_geocode_cache(cache)
+        except OSError:
+            pass  # Caching is best-effort
+
+
+def _cached_geocoding(func):
+    """Serve repeat lookups of the same place from the on-disk cache."""
+
+    @functools.wraps(func)
+    def wrapper(place_name, use_cache=True):
+        if not use_cache:
+            return func(place_name)
 
+        key = place_name.strip().lower()
+        with _GEOCODE_CACHE_LOCK:
+            cache = _load_geocode_cache()
+            entry = cache.get(key)
+        if entry and time.time() - entry["timestamp"] < GEOCODE_CACHE_TTL:
+            return entry["result"]
 
+        result = func(place_name)
+        if result:
+            with _GEOCODE_CACHE_LOCK:
+                cache[key] = {"timestamp": time.time(), "result": result}
+                try:
+                    _save_geocode_cache(cache)
+                except OSError:
+                    pass  # Caching is best-effort
+        return result
+
+    return wrapper
+
+
+@_cached_geocoding
 def get_coordinates(place_name):
     url = "https://geocoding-api.open-meteo.com/v1/search"
     params = {"name": place_name, "count": 1, "language": "en", "format": "json"}
-    response = requests.get(url, params=params)
+    response = _session().get(url, params=params, timeout=REQUEST_TIMEOUT)
     response.raise_for_status()
-    data = response.json()
+    data = _decode_json(response)
     if "results" in data and data["results"]:
         return data["results"][0]
     return None
 
 
-def fetch_weather_data(lat, lon, start_date, end_date, timezone="auto"):
-    url = "https://archive-api.open-meteo.com/v1/archive"
-    params = {
-        "latitude": lat,
-        "longitude": lon,
+def get_coordinates_many(place_names, use_cache=True):
+    """Geocode several places concurrently, returning results in input order."""
+    if not place_names:
+        return []
+    if len(place_names) == 1:
+        return [get_coordinates(place_names[0], use_cache=use_cache)]
+
+    workers = min(len(place_names), MAX_GEOCODING_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                functools.partial(get_coordinates, use_cache=use_cache), place_names
+            )
+        )
+
+
+def _archive_params(points, start_date, end_date, timezone):
+    """Build archive API query parameters for one or more (lat, lon) points."""
+    return {
+        "latitude": ",".join(str(lat) for lat, _ in points),
+        "longitude": ",".join(str(lon) for _, lon in points),
         "start_date": start_date,
         "end_date": end_date,
         "daily": "temperature_2m_max,temperature_2m_min,temperature_2m_mean",
         "timezone": timezone,
     }
-    response = requests.get(url, params=params)
+
+
+def fetch_weather_data_batch(points, start_date, end_date, timezone="auto"):
+    """
+    Fetch weather data for several (lat, lon) points in a single request.
+
+    Returns one response dict per point, in the same order as `points`.
+    """
+    url = "https://archive-api.open-meteo.com/v1/archive"
+    params = _archive_params(points, start_date, end_date, timezone)
+    response = _session().get(url, params=params, timeout=REQUEST_TIMEOUT)
     response.raise_for_status()
-    return response.json()
+    data = _decode_json(response)
+    # The API returns a plain object for one point and a list for several
+    if isinstance(data, dict):
+        return [data]
+    return data
+
+
+def fetch_weather_data(lat, lon, start_date, end_date, timezone="auto"):
+    return fetch_weather_data_batch([(lat, lon)], start_date, end_date, timezone)[0]
+
+
+def _year_chunks(start_date, end_date, chunk_years):
+    """Split an ISO date range into spans of `chunk_years` calendar years."""
+    start = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
+    chunks = []
+    while start <= end:
+        chunk_end = min(date(start.year + chunk_years - 1, 12, 31), end)
+        chunks.append((start.isoformat(), chunk_end.isoformat()))
+        start = chunk_end + timedelta(days=1)
+    return chunks
 
 
-def parse_date_input(date_str, is_start=True):
+def fetch_weather_data_chunked(
+    lat, lon, start_date, end_date, chunk_years=1, timezone="auto"
+):
+    """
+    Fetch a long date range as parallel requests of `chunk_years` years each.
+
+    The per-chunk `daily` arrays are concatenated in time order, so the result
+    has the same shape as `fetch_weather_data`.
+    """
+    chunks = _year_chunks(start_date, end_date, chunk_years)
+    if len(chunks) <= 1:
+        return fetch_weather_data(lat, lon, start_date, end_date, timezone)
+
+    with ThreadPoolExecutor(max_workers=MAX_ARCHIVE_WORKERS) as executor:
+        results = list(
+            executor.map(
+                lambda chunk: fetch_weather_data(lat, lon, *chunk, timezone), chunks
+            )
+        )
+
+    merged = results[0]
+    for result in results[1:]:
+        for key, values in result.get("daily", {}).items():
+            merged["daily"][key].extend(values)
+    return merged
+
+
+def fetch_weather_data_raw(lat, lon, start_date, end_date, timezone="auto"):
+    """Fetch weather data for one point as the raw, undecoded JSON body."""
+    url = "https://archive-api.open-meteo.com/v1/archive"
+    params = _archive_params([(lat, lon)], start_date, end_date, timezone)
+    response = _session().get(url, params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.content
+
+
+def _dumps(obj):
+    """Serialize `obj` to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _dumps_with_raw(obj, key, raw):
+    """Serialize `obj` with the already-encoded JSON `raw` appended under `key`."""
+    head = _dumps(obj).rstrip()[:-1].rstrip()  # Drop the closing brace
+    separator = b"," if obj else b""
+    return head + separator + b"\n  " + _dumps(key) + b": " + raw + b"\n}"
+
+
+# Process umask, read once (os.umask can only be queried by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _write_json(filename, obj):
+    """
+    Write `obj` (or already-encoded JSON bytes) to `filename` atomically.
+
+    The payload goes to a temporary file that then replaces the target, so an
+    interrupted run never leaves a truncated JSON file behind.
+    """
+    payload = obj if isinstance(obj, bytes) else _dumps(obj)
+    # A unique temp file per writer, so concurrent runs never share one
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(filename) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        # mkstemp creates the file private; give it regular file permissions
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# YYYY, YYYY-MM or YYYY-MM-DD (month and day may be one or two digits)
+_DATE_RE = re.compile(r"(\d{4})(?:-(\d{1,2})(?:-(\d{1,2}))?)?", re.ASCII)
+
+
+def _parse_yyyy(year, is_start, yesterday):
+    """Parse a YYYY date (e.g., "2023")."""
+    try:
+        if is_start:
+            result_date = f"{year}-01-01"
+        else:
+            result_date = f"{year}-12-31"
+            # Clamp end date to yesterday if it's in the future
+            if date(year, 12, 31) > yesterday:
+                result_date = yesterday.isoformat()
+        return result_date
+    except ValueError:
+        raise ValueError("Invalid year format. Please use YYYY.")
+
+
+def _parse_yyyy_mm(year, month, is_start, yesterday):
+    """Parse a YYYY-MM date (e.g., "2023-05")."""
+    try:
+        if month < 1 or month > 12:
+            raise ValueError("Month must be between 1 and 12.")
+
+        if is_start:
+            result_date = f"{year}-{month:02d}-01"
+        else:
+            last_day = calendar.monthrange(year, month)[1]
+            result_date = f"{year}-{month:02d}-{last_day:02d}"
+            # Clamp end date to yesterday if it's in the future
+            if date(year, month, last_day) > yesterday:
+                result_date = yesterday.isoformat()
+        return result_date
+    except ValueError:
+        raise ValueError("Invalid year-month format. Please use YYYY-MM.")
+
+
+def _parse_iso(year, month, day, is_start, yesterday):
+    """Parse a YYYY-MM-DD date (e.g., "2023-05-15")."""
+    try:
+        parsed_date = date(year, month, day)
+        if not is_start and parsed_date > yesterday:
+            # Clamp end date to yesterday if it's in the future
+            return yesterday.isoformat()
+        return parsed_date.isoformat()
+    except ValueError:
+        raise ValueError("Invalid date format. Please use YYYY-MM-DD.")
+
+
+def parse_date_input(date_str, is_start=True, yesterday=None):
     """
     Parse date input that can be:
     - YYYY (e.g., "2023")
@@ -43,75 +383,33 @@ def parse_date_input(date_str, is_start=True):
 
     For start dates: defaults to first day/month
     For end dates: defaults to last day/month, but clamped to yesterday at most
-    """
-    date_str = date_str.strip()
-    yesterday = datetime.now() - relativedelta(days=1)
-
-    if len(date_str) == 4:  # YYYY format
-        try:
-            year = int(date_str)
-            if is_start:
-                result_date = f"{year}-01-01"
-            else:
-                result_date = f"{year}-12-31"
-                # Clamp end date to yesterday if it's in the future
-                parsed_date = datetime.strptime(result_date, "%Y-%m-%d")
-                if parsed_date > yesterday:
-                    result_date = yesterday.strftime("%Y-%m-%d")
-            return result_date
-        except ValueError:
-            raise ValueError("Invalid year format. Please use YYYY.")
-
-    elif len(date_str) == 7 and date_str[4] == "-":  # YYYY-MM format
-        try:
-            year, month = date_str.split("-")
-            year = int(year)
-            month = int(month)
-
-            if month < 1 or month > 12:
-                raise ValueError("Month must be between 1 and 12.")
-
-            if is_start:
-                result_date = f"{year}-{month:02d}-01"
-            else:
-                # Get last day of the month
-                if month == 12:
-                    next_month_date = datetime(year + 1, 1, 1)
-                else:
-                    next_month_date = datetime(year, month + 1, 1)
-                last_day = (next_month_date - relativedelta(days=1)).day
-                result_date = f"{year}-{month:02d}-{last_day:02d}"
-                # Clamp end date to yesterday if it's in the future
-                parsed_date = datetime.strptime(result_date, "%Y-%m-%d")
-                if parsed_date > yesterday:
-                    result_date = yesterday.strftime("%Y-%m-%d")
-            return result_date
-        except ValueError:
-            raise ValueError("Invalid year-month format. Please use YYYY-MM.")
-
-    elif (
-        len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-"
-    ):  # YYYY-MM-DD format
-        try:
-            parsed_date = datetime.strptime(date_str, "%Y-%m-%d")
-            if not is_start and parsed_date > yesterday:
-                # Clamp end date to yesterday if it's in the future
-                return yesterday.strftime("%Y-%m-%d")
-            return date_str
-        except ValueError:
-            raise ValueError("Invalid date format. Please use YYYY-MM-DD.")
 
-    else:
+    Callers parsing many end dates can pass a precomputed `yesterday` (a date)
+    to share one value; otherwise it is computed only when needed.
+    """
+    match = _DATE_RE.fullmatch(date_str.strip())
+    if not match:
         raise ValueError(
             "Invalid date format. Please use YYYY, YYYY-MM, or YYYY-MM-DD."
         )
+    if yesterday is None and not is_start:
+        yesterday = date.today() - timedelta(days=1)
 
+    year = int(match.group(1))
+    month = match.group(2)
+    day = match.group(3)
+    if month is None:
+        return _parse_yyyy(year, is_start, yesterday)
+    if day is None:
+        return _parse_yyyy_mm(year, int(month), is_start, yesterday)
+    return _parse_iso(year, int(month), int(day), is_start, yesterday)
 
-def get_location_interactive():
+
+def get_location_interactive(use_cache=True):
     """Get location through interactive input."""
     while True:
         place = input("🔎 Enter the name of the location: ").strip()
-        location = get_coordinates(place)
+        location = get_coordinates(place, use_cache=use_cache)
 
         if not location:
             print("❌ Location not found. Try a different name.")
@@ -147,6 +445,89 @@ def get_dates_interactive():
         return None, None
 
 
+def read_batch_input(lines):
+    """
+    Parse piped batch input, one "location,start,end" per line.
+
+    Blank lines and lines starting with "#" are skipped. Returns a list of
+    (place, start_date, end_date) tuples with dates already normalized.
+    """
+    jobs = []
+    yesterday = date.today() - timedelta(days=1)
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        # Split from the right so place names may contain commas
+        parts = line.rsplit(",", 2)
+        if len(parts) != 3:
+            raise ValueError(
+                f"Line {line_number}: expected 'location,start,end', got '{line}'"
+            )
+        place, start, end = (part.strip() for part in parts)
+        try:
+            jobs.append(
+                (
+                    place,
+                    parse_date_input(start, is_start=True),
+                    parse_date_input(end, is_start=False, yesterday=yesterday),
+                )
+            )
+        except ValueError as e:
+            raise ValueError(f"Line {line_number}: {e}")
+    return jobs
+
+
+def process_batch_input(jobs, output_filename=None, use_cache=True, chunk_years=None):
+    """Geocode all batch jobs at once and fetch each date range in one request."""
+    places = list(dict.fromkeys(place for place, _, _ in jobs))
+    resolved = dict(zip(places, get_coordinates_many(places, use_cache=use_cache)))
+
+    # Group locations sharing a date range so each range is a single request
+    groups = {}
+    for place, start_date, end_date in jobs:
+        location = resolved[place]
+        if not location:
+            print(f"❌ Location '{place}' not found, skipping.")
+            continue
+        groups.setdefault((start_date, end_date), []).append(location)
+
+    ok = True
+    for (start_date, end_date), locations in groups.items():
+        # Keep custom filenames distinct per date range
+        filename = output_filename
+        if output_filename and len(groups) > 1:
+            filename = f"{output_filename}_{start_date}_to_{end_date}"
+        ok &= process_weather_data_batch(
+            locations, start_date, end_date, filename, chunk_years
+        )
+    return ok
+
+
+def _start_date(date_str):
+    """argparse type for start dates: parse and validate at the CLI boundary."""
+    try:
+        return parse_date_input(date_str, is_start=True)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _end_date(date_str):
+    """argparse type for end dates: parse and validate at the CLI boundary."""
+    try:
+        return parse_date_input(date_str, is_start=False)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _positive_int(value):
+    """argparse type for strictly positive integers."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return number
+
+
 def parse_arguments():
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(
@@ -160,6 +541,8 @@ Examples:
   %(prog)s --check-location "London" --location-output-file "london_coords"
   %(prog)s -c "San Francisco"
   %(prog)s -l "Berlin" -s "2024" -e "2024" --output-file "berlin_temp_data"
+  %(prog)s -l "Rome" -l "Milan" -l "Naples" -s "2000" -e "2024"
+  %(prog)s < jobs.txt    (one "location,start,end" per line)
         """,
     )
 
@@ -167,20 +550,21 @@ Examples:
         "-l",
         "--location",
         type=str,
-        help="Name of the location to fetch weather data for",
+        action="append",
+        help="Name of the location to fetch weather data for (repeat to fetch several in one request)",
     )
 
     parser.add_argument(
         "-s",
         "--start-date",
-        type=str,
+        type=_start_date,
         help="Start date (YYYY, YYYY-MM, or YYYY-MM-DD format)",
     )
 
     parser.add_argument(
         "-e",
         "--end-date",
-        type=str,
+        type=_end_date,
         help="End date (YYYY, YYYY-MM, or YYYY-MM-DD format)",
     )
 
@@ -204,23 +588,25 @@ Examples:
         help="Custom filename for location check output (without .json extension)",
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--chunk-years",
+        type=_positive_int,
+        metavar="N",
+        help="Fetch a single location's range as parallel requests of N years each",
+    )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk geocoding and HTTP caches and always query the API",
+    )
 
-def process_weather_data(location, start_date, end_date, output_filename=None):
-    """Process weather data for given location and date range."""
-    print(f"📥 Fetching data from {start_date} to {end_date}...")
+    return parser.parse_args()
 
-    try:
-        data = fetch_weather_data(
-            location["latitude"], location["longitude"], start_date, end_date
-        )
-    except Exception as e:
-        print(f"❌ Failed to fetch data: {e}")
-        return False
 
-    # Add location metadata to the data
-    enhanced_data = {
+def build_metadata(location, start_date, end_date):
+    """Build the source/location/date-range wrapper saved around weather data."""
+    return {
         "source": {
             "name": "Open-Meteo",
             "description": "Open-source weather API with historical weather data",
@@ -236,31 +622,135 @@ def process_weather_data(location, start_date, end_date, output_filename=None):
             "longitude": location["longitude"],
         },
         "date_range": {"start_date": start_date, "end_date": end_date},
-        "weather_data": data,
     }
 
-    # Use custom filename if provided, otherwise use default format
+
+def _slug(name):
+    """Turn a place name into a filename fragment (whitespace runs become "_")."""
+    return _WHITESPACE_RE.sub("_", name.strip())
+
+
+def output_path(location, start_date, end_date, output_filename=None):
+    """Return the JSON filename for a fetch, honouring a custom name if given."""
     if output_filename:
-        filename = f"{output_filename}.json"
-    else:
-        filename = (
-            f"{location['name'].replace(' ', '_')}_{start_date}_to_{end_date}.json"
-        )
+        return f"{output_filename}.json"
+    return f"{_slug(location['name'])}_{start_date}_to_{end_date}.json"
+
+
+def run_fetch(place, start_date, end_date, output_filename=None, use_cache=True):
+    """
+    Geocode `place`, fetch its weather data and save it, without printing.
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(enhanced_data, f, indent=4)
+    Dates must already be normalized (see `parse_date_input`). Returns
+    `(enhanced_data, filename)` so callers can use the data in-memory instead
+    of re-reading the file. Raises LookupError if the place is not found.
+    """
+    location = get_coordinates(place, use_cache=use_cache)
+    if not location:
+        raise LookupError(f"Location '{place}' not found.")
+
+    enhanced_data = build_metadata(location, start_date, end_date)
+    enhanced_data["weather_data"] = fetch_weather_data(
+        location["latitude"], location["longitude"], start_date, end_date
+    )
+    filename = output_path(location, start_date, end_date, output_filename)
+    _write_json(filename, enhanced_data)
+    return enhanced_data, filename
+
+
+def process_weather_data(
+    location, start_date, end_date, output_filename=None, data=None, chunk_years=None
+):
+    """Process weather data for given location and date range.
+
+    If `data` is given (e.g. from a batched request), no fetch is performed.
+    If `chunk_years` is given, the range is fetched as parallel yearly chunks.
+    Otherwise the raw API body is written out as-is, without a decode/encode
+    round trip.
+    """
+    if data is None:
+        print(f"📥 Fetching data from {start_date} to {end_date}...")
+
+        try:
+            if chunk_years:
+                data = fetch_weather_data_chunked(
+                    location["latitude"],
+                    location["longitude"],
+                    start_date,
+                    end_date,
+                    chunk_years,
+                )
+            else:
+                data = fetch_weather_data_raw(
+                    location["latitude"], location["longitude"], start_date, end_date
+                )
+        except Exception as e:
+            print(f"❌ Failed to fetch data: {e}")
+            return False
+
+    # Add location metadata to the data
+    enhanced_data = build_metadata(location, start_date, end_date)
+    filename = output_path(location, start_date, end_date, output_filename)
+
+    if isinstance(data, bytes):
+        _write_json(filename, _dumps_with_raw(enhanced_data, "weather_data", data))
+    else:
+        enhanced_data["weather_data"] = data
+        _write_json(filename, enhanced_data)
 
     print(f"✅ Data saved to `{filename}`")
     return True
 
 
+def process_weather_data_batch(
+    locations, start_date, end_date, output_filename=None, chunk_years=None
+):
+    """Fetch all locations in a single request and save one file per location.
+
+    `chunk_years` only applies to a single location (see `process_weather_data`).
+    """
+    if len(locations) == 1:
+        return process_weather_data(
+            locations[0],
+            start_date,
+            end_date,
+            output_filename,
+            chunk_years=chunk_years,
+        )
+
+    print(
+        f"📥 Fetching data for {len(locations)} locations from {start_date} to {end_date}..."
+    )
+
+    try:
+        results = fetch_weather_data_batch(
+            [(loc["latitude"], loc["longitude"]) for loc in locations],
+            start_date,
+            end_date,
+        )
+    except Exception as e:
+        print(f"❌ Failed to fetch data: {e}")
+        return False
+
+    ok = True
+    for location, data in zip(locations, results):
+        # Keep custom filenames distinct per location
+        filename = (
+            f"{output_filename}_{_slug(location['name'])}" if output_filename else None
+        )
+        ok &= process_weather_data(location, start_date, end_date, filename, data)
+    return ok
+
+
 def main():
     args = parse_arguments()
+    if args.no_cache:
+        disable_http_cache()
 
     # Handle check-location mode
     if args.check_location:
         print(f"🔎 Looking up location: {args.check_location}")
-        location = get_coordinates(args.check_location)
+        location = get_coordinates(args.check_location, use_cache=not args.no_cache)
         if not location:
             print(f"❌ Location '{args.check_location}' not found.")
             return
@@ -290,36 +780,55 @@ def main():
         if args.location_output_file:
             filename = f"{args.location_output_file}.json"
         else:
-            filename = f"location_{location['name'].replace(' ', '_')}.json"
+            filename = f"location_{_slug(location['name'])}.json"
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(location_data, f, indent=4)
+        _write_json(filename, location_data)
 
         print(f"💾 Location data saved to `{filename}`")
         return
 
+    # Batch mode: jobs piped on stdin, no prompts
+    if not (args.location or args.start_date or args.end_date) and (
+        not sys.stdin.isatty()
+    ):
+        print("📄 Reading batch jobs from stdin...")
+        try:
+            jobs = read_batch_input(sys.stdin.read().splitlines())
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+        if not jobs:
+            print("⚠️ No batch jobs on stdin, nothing to do.")
+            return
+        process_batch_input(
+            jobs,
+            args.output_file,
+            use_cache=not args.no_cache,
+            chunk_years=args.chunk_years,
+        )
+        return
+
     # Check if all required arguments are provided
     if args.location and args.start_date and args.end_date:
         # Use command-line arguments
         print("🚀 Using command-line arguments...")
 
-        # Get location from argument
-        location = get_coordinates(args.location)
-        if not location:
-            print(f"❌ Location '{args.location}' not found.")
-            return
+        # Get locations from arguments
+        locations = []
+        results = get_coordinates_many(args.location, use_cache=not args.no_cache)
+        for place, location in zip(args.location, results):
+            if not location:
+                print(f"❌ Location '{place}' not found.")
+                return
 
-        print(
-            f"✅ Found: {location['name']}, {location.get('country', '')} (lat: {location['latitude']}, lon: {location['longitude']})"
-        )
+            print(
+                f"✅ Found: {location['name']}, {location.get('country', '')} (lat: {location['latitude']}, lon: {location['longitude']})"
+            )
+            locations.append(location)
 
-        # Parse dates from arguments
-        try:
-            start_date = parse_date_input(args.start_date, is_start=True)
-            end_date = parse_date_input(args.end_date, is_start=False)
-        except ValueError as e:
-            print(f"❌ {e}")
-            return
+        # Dates were already parsed and validated by argparse
+        start_date = args.start_date
+        end_date = args.end_date
 
     else:
         # Use interactive mode
@@ -331,7 +840,7 @@ def main():
         #     print("🎮 Interactive mode - no arguments provided...")
 
         # Get location interactively
-        location = get_location_interactive()
+        locations = [get_location_interactive(use_cache=not args.no_cache)]
 
         # Get dates interactively
         start_date, end_date = get_dates_interactive()
@@ -339,7 +848,9 @@ def main():
             return
 
     # Process the weather data
-    process_weather_data(location, start_date, end_date, args.output_file)
+    process_weather_data_batch(
+        locations, start_date, end_date, args.output_file, args.chunk_years
+    )
 
 
 if __name__ == "__main__":
@@ -1,15 +1,232 @@
 #!/usr/bin/env python3
 
 import argparse
+import calendar
+import functools
 import json
 import os
+import sys
+from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
+
+import matplotlib
+
+# Save-only CLI runs never open a window, so skip loading a GUI backend
+if __name__ == "__main__" and ("-n" in sys.argv or "--no-display" in sys.argv):
+    matplotlib.use("Agg")
 
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
+from matplotlib.font_manager import FontProperties
 import numpy as np
 import pandas as pd
-import seaborn as sns
+
+# Month names indexed 1-12 (index 0 is empty)
+_MONTH_NAMES = list(calendar.month_name)
+
+# Chart style shared by both themes (the rcParams seaborn's whitegrid and
+# darkgrid themes used to set), plus the per-theme overrides
+_BASE_STYLE = {
+    "axes.axisbelow": True,
+    "axes.grid": True,
+    "axes.labelcolor": ".15",
+    "axes.labelsize": 12,
+    "axes.linewidth": 1.25,
+    "axes.titlesize": 12,
+    "font.size": 12,
+    "font.sans-serif": [
+        "Arial",
+        "DejaVu Sans",
+        "Liberation Sans",
+        "Bitstream Vera Sans",
+        "sans-serif",
+    ],
+    "grid.linewidth": 1.0,
+    "legend.fontsize": 11,
+    "legend.title_fontsize": 12,
+    "lines.solid_capstyle": "round",
+    "patch.edgecolor": "w",
+    "patch.force_edgecolor": True,
+    "text.color": ".15",
+    "xtick.bottom": False,
+    "xtick.color": ".15",
+    "xtick.labelsize": 11,
+    "xtick.major.size": 6,
+    "xtick.major.width": 1.25,
+    "xtick.minor.size": 4,
+    "xtick.minor.width": 1.0,
+    "ytick.color": ".15",
+    "ytick.labelsize": 11,
+    "ytick.major.size": 6,
+    "ytick.major.width": 1.25,
+    "ytick.minor.size": 4,
+    "ytick.minor.width": 1.0,
+    "ytick.left": False,
+}
+_LIGHT_STYLE = {"axes.facecolor": "white", "axes.edgecolor": ".8", "grid.color": ".8"}
+# The legend inherits axes.facecolor; the axes themselves are painted black
+_DARK_STYLE = {
+    "axes.facecolor": "#EAEAF2",
+    "axes.edgecolor": "white",
+    "grid.color": "white",
+}
+
+# Fonts shared by every chart instead of per-call size/weight keywords
+_TITLE_FP = FontProperties(size=18, weight="bold")
+_AXIS_FP = FontProperties(size=12)
+_ANNOT_FP = FontProperties(size=9, weight="bold")
+_SOURCE_FP = FontProperties(size=8, style="italic")
+
+# Output extensions saved as vector charts with rasterized data artists
+VECTOR_FORMATS = (".pdf", ".svg")
+
+try:
+    import orjson
+except ImportError:  # Optional, falls back to the stdlib json module
+    orjson = None
+
+
+@dataclass
+class _Meta:
+    """Display strings taken once from a weather JSON file's metadata."""
+
+    __slots__ = ("location_display", "source_text", "location_coords")
+
+    location_display: str
+    source_text: str
+    location_coords: str
+
+
+def _extract_meta(data):
+    """Build the chart's location, source and filename strings from `data`."""
+    location_info = data.get("location", {})
+    location_name = location_info.get("name", "Unknown Location")
+    location_country = location_info.get("country", "")
+
+    source_info = data.get("source", {})
+    source_text = f"Fonte: {source_info.get('name', 'Unknown Source')}"
+    if source_info.get("website"):
+        source_text += f" ({source_info['website']})"
+
+    weather_data = data.get("weather_data", {})
+    latitude = weather_data.get("latitude", "")
+    longitude = weather_data.get("longitude", "")
+
+    return _Meta(
+        location_display=(
+            f"{location_name}, {location_country}"
+            if location_country
+            else location_name
+        ),
+        source_text=source_text,
+        location_coords=f"{latitude}_{longitude}",
+    )
+
+
+def _year_month(times):
+    """Extract int16 year and month arrays from ISO "YYYY-MM-DD" strings."""
+    digits = np.asarray(times, dtype="S10").view(np.uint8).reshape(-1, 10)
+    digits = digits.astype(np.int16) - ord("0")
+    year = digits[:, 0] * 1000 + digits[:, 1] * 100 + digits[:, 2] * 10 + digits[:, 3]
+    month = digits[:, 5] * 10 + digits[:, 6]
+    return year, month
+
+
+def _year_window(year_arr, first_year, last_year, columns):
+    """
+    Restrict `columns` to the rows whose year is within [first_year, last_year].
+
+    Chronological data, as Open-Meteo returns it, is cut with two binary
+    searches into slices; unsorted data falls back to a boolean mask.
+    A bound of None leaves that side open.
+    """
+    if np.any(year_arr[1:] < year_arr[:-1]):
+        keep = np.ones(len(year_arr), dtype=bool)
+        if first_year is not None:
+            keep &= year_arr >= first_year
+        if last_year is not None:
+            keep &= year_arr <= last_year
+        return [column[keep] for column in columns]
+
+    start = 0 if first_year is None else np.searchsorted(year_arr, first_year, "left")
+    stop = (
+        len(year_arr)
+        if last_year is None
+        else np.searchsorted(year_arr, last_year, "right")
+    )
+    return [column[start:stop] for column in columns]
+
+
+def _linear_fit(x, y):
+    """Closed-form least-squares line through (x, y); returns (slope, intercept)."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+    denominator = (dx**2).sum()
+    # A single year has no slope; draw a flat line through it
+    slope = (dx * (y - y_mean)).sum() / denominator if denominator else 0.0
+    return slope, y_mean - slope * x_mean
+
+
+def _group_means(codes, columns):
+    """
+    Per-group mean of each column by integer group `codes`, skipping NaNs.
+
+    All columns are reduced together in one pass over year-sorted rows.
+    Returns an array of shape (n_groups, len(columns)).
+    """
+    values = np.column_stack(columns).astype(np.float64)
+    if np.any(codes[1:] < codes[:-1]):
+        order = np.argsort(codes, kind="stable")
+        codes, values = codes[order], values[order]
+    valid = ~np.isnan(values)
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    sums = np.add.reduceat(np.where(valid, values, 0.0), starts)
+    counts = np.add.reduceat(valid.astype(np.int64), starts)
+    # Groups with no valid values yield NaN, as pandas' mean does
+    with np.errstate(invalid="ignore"):
+        return sums / counts
+
+
+def _month_bits(start_month, end_month):
+    """Bitmask with bit m set for each month m in the (possibly wrapping) range."""
+    if start_month <= end_month:
+        # Same year range (e.g., March to August)
+        months = range(start_month, end_month + 1)
+    else:
+        # Cross-year range (e.g., November to February)
+        months = [*range(start_month, 13), *range(1, end_month + 1)]
+    bits = 0
+    for m in months:
+        bits |= 1 << m
+    return bits
+
+
+@functools.lru_cache(maxsize=64)
+def _format_labels(year, year_range, month, month_range):
+    """Return the chart's (title_suffix, filename_suffix) for the given filters."""
+    title_suffix = ""
+    filename_suffix = ""
+    if year is not None:
+        title_suffix = f" - Anno {year}"
+        filename_suffix = f"_year{year}"
+    elif year_range is not None:
+        title_suffix = f" - Anni {year_range[0]}-{year_range[1]}"
+        filename_suffix = f"_years{year_range[0]}-{year_range[1]}"
+
+    if month is not None:
+        title_suffix += f" - {_MONTH_NAMES[month]}"
+        filename_suffix += f"_month{month:02d}"
+    elif month_range is not None:
+        title_suffix += (
+            f" - {_MONTH_NAMES[month_range[0]]} a {_MONTH_NAMES[month_range[1]]}"
+        )
+        filename_suffix += f"_months{month_range[0]:02d}-{month_range[1]:02d}"
+
+    return title_suffix, filename_suffix
 
 
 def visualize_weather_data(
@@ -22,68 +239,59 @@ def visualize_weather_data(
     show_trend=False,
     output_filename=None,
     no_display=False,
+    fig=None,
+    dpi=150,
 ):
+    """
+    Plot yearly mean temperatures from a weather JSON file and save the chart.
+
+    Pass `fig` to draw on an existing Figure instead of creating a new one;
+    it is cleared first and left open afterwards for the next chart.
+    """
     if not os.path.exists(filename):
         print(f"❌ File '{filename}' not found.")
         return
 
-    with open(filename, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    # Extract location and weather data from new structure
-    location_info = data.get("location", {})
-    location_name = location_info.get("name", "Unknown Location")
-    location_country = location_info.get("country", "")
-    location_display = (
-        f"{location_name}, {location_country}" if location_country else location_name
-    )
-
-    # Extract source information
-    source_info = data.get("source", {})
-    source_name = source_info.get("name", "Unknown Source")
+    # Parse the raw bytes directly; both parsers accept UTF-8 bytes
+    raw = Path(filename).read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    del raw
 
-    # Extract coordinates for filename
+    # Extract coordinates and daily data from new structure
     weather_data = data.get("weather_data", {})
     if not weather_data:
         print("❌ No weather data found in the file.")
         return
 
-    latitude = weather_data.get("latitude", "")
-    longitude = weather_data.get("longitude", "")
-    location_coords = f"{latitude}_{longitude}"
+    meta = _extract_meta(data)
 
     daily_data = weather_data.get("daily", {})
     if not daily_data:
         print("❌ No daily data found in the file.")
         return
 
-    # Create DataFrame
-    df = pd.DataFrame(
-        {
-            "date": daily_data.get("time", []),
-            "temp_min": daily_data.get("temperature_2m_min", []),
-            "temp_max": daily_data.get("temperature_2m_max", []),
-            "temp_mean": daily_data.get("temperature_2m_mean", []),
-        }
-    )
+    # Typed columns; float32 is ample for 0.1°C data and missing values
+    # (null) become NaN
+    year_arr, month_arr = _year_month(daily_data.get("time", []))
+    tmin = np.asarray(daily_data.get("temperature_2m_min", []), dtype=np.float32)
+    tmax = np.asarray(daily_data.get("temperature_2m_max", []), dtype=np.float32)
+    tmean = np.asarray(daily_data.get("temperature_2m_mean", []), dtype=np.float32)
 
-    df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%d")
-    df["year"] = df["date"].dt.year
-    df["month"] = df["date"].dt.month
+    # Everything needed now lives in `meta` and the arrays; free the parsed
+    # JSON tree before the plotting buffers are allocated
+    del data, weather_data, daily_data
 
     # Get current date for filtering
     current_date = datetime.now()
     current_year = current_date.year
     current_month = current_date.month
 
-    # Apply filters
-    df_filtered = df.copy()
-
-    # Filter by year
+    # Resolve the year filter to an inclusive [first_year, last_year] window
+    first_year = last_year = None
     if year is not None:
         if year >= current_year:
             year = min(year, current_year - 1)
-        df_filtered = df_filtered[df_filtered["year"] == year]
+        first_year = last_year = year
         print(f"🔍 Filtering data for year: {year}")
     elif year_range is not None:
         start_year, end_year = year_range
@@ -94,281 +302,287 @@ def visualize_weather_data(
                 f"❌ No data available: start year {start_year} is current year or later"
             )
             return
-        df_filtered = df_filtered[
-            (df_filtered["year"] >= start_year) & (df_filtered["year"] <= end_year)
-        ]
+        first_year, last_year = start_year, end_year
         print(f"🔍 Filtering data for years: {start_year}-{end_year}")
-    else:
+    elif month is None and month_range is None:
         # If no year filter specified, exclude current year only if no month filter is applied
         # When month filtering is used, we want to include current year data for past months
-        if month is None and month_range is None:
-            df_filtered = df_filtered[df_filtered["year"] < current_year]
+        last_year = current_year - 1
+
+    if first_year is not None or last_year is not None:
+        year_arr, month_arr, tmin, tmax, tmean = _year_window(
+            year_arr, first_year, last_year, (year_arr, month_arr, tmin, tmax, tmean)
+        )
+
+    # Apply the remaining filters as a single boolean mask over the window
+    mask = np.ones(len(year_arr), dtype=bool)
 
     # Filter by month
     if month is not None:
         # Only exclude future months for the current year, not past completed months
-        df_filtered = df_filtered[
-            ~(
-                (df_filtered["year"] == current_year)
-                & (df_filtered["month"] > current_month)
-            )
-        ]
-        df_filtered = df_filtered[df_filtered["month"] == month]
-        month_name = (
-            df_filtered["date"].dt.strftime("%B").iloc[0]
-            if not df_filtered.empty
-            else f"Month {month}"
-        )
-        print(f"🔍 Filtering data for month: {month_name}")
+        mask &= ~((year_arr == current_year) & (month_arr > current_month))
+        mask &= month_arr == month
+        print(f"🔍 Filtering data for month: {_MONTH_NAMES[month]}")
     elif month_range is not None:
         start_month, end_month = month_range
         # Only exclude future months for the current year, not past completed months
-        df_filtered = df_filtered[
-            ~(
-                (df_filtered["year"] == current_year)
-                & (df_filtered["month"] > current_month)
-            )
-        ]
-        if start_month <= end_month:
-            # Same year range (e.g., March to August)
-            df_filtered = df_filtered[
-                (df_filtered["month"] >= start_month)
-                & (df_filtered["month"] <= end_month)
-            ]
-        else:
-            # Cross-year range (e.g., November to February)
-            df_filtered = df_filtered[
-                (df_filtered["month"] >= start_month)
-                | (df_filtered["month"] <= end_month)
-            ]
+        mask &= ~((year_arr == current_year) & (month_arr > current_month))
+        # One shift-and-test against a bitmask of the allowed months
+        allowed = np.int16(_month_bits(start_month, end_month))
+        mask &= ((allowed >> month_arr) & 1).astype(bool)
         print(f"🔍 Filtering data for months: {start_month}-{end_month}")
     else:
         # If no month filter specified, exclude current and future months for current year
-        df_filtered = df_filtered[
-            ~(
-                (df_filtered["year"] == current_year)
-                & (df_filtered["month"] >= current_month)
-            )
-        ]
+        mask &= ~((year_arr == current_year) & (month_arr >= current_month))
 
     # Remove rows with missing mean temp
-    df_clean = df_filtered.dropna(subset=["temp_mean"])
+    mask &= ~np.isnan(tmean)
 
-    if df_clean.empty:
+    if not mask.any():
         print("⚠️ No usable temperature data found.")
         return
 
-    # Compute yearly average
-    yearly_stats = (
-        df_clean.groupby("year")
-        .agg({"temp_mean": "mean", "temp_min": "mean", "temp_max": "mean"})
-        .reset_index()
-    )
-
-    # Plotting
+    # Compute yearly average straight from the masked columns; min/max are
+    # only needed for the range band, so skip them when there are none
+    tmin, tmax = tmin[mask], tmax[mask]
+    has_range = not (np.isnan(tmin).all() or np.isnan(tmax).all())
+    columns = [tmean[mask], tmin, tmax] if has_range else [tmean[mask]]
+
+    years, codes = np.unique(year_arr[mask], return_inverse=True)
+    means = _group_means(codes, columns)
+    yearly_stats = pd.DataFrame({"year": years, "temp_mean": means[:, 0]})
+    if has_range:
+        yearly_stats["temp_min"] = means[:, 1]
+        yearly_stats["temp_max"] = means[:, 2]
+
+    # Plotting; the theme is scoped to this chart so the caller's rcParams
+    # are left as they were
     if dark_theme:
         print("🌙 Using dark theme")
-        plt.style.use("dark_background")
-        sns.set_theme(style="darkgrid", palette="bright")
-        fig, ax = plt.subplots(figsize=(15, 8))
-        # Set dark background colors explicitly
-        fig.patch.set_facecolor("black")
-        ax.set_facecolor("black")
-    else:
-        sns.set_theme(style="whitegrid", palette="muted")
-        fig, ax = plt.subplots(figsize=(15, 8))
-
-    # Fill range between min and max
-    if dark_theme:
-        fill_color = "steelblue"
-        line_color = "cyan"
-        grid_color = "gray"
+        style, theme = "dark_background", _DARK_STYLE
     else:
-        fill_color = "skyblue"
-        line_color = "royalblue"
-        grid_color = None
-
-    ax.fill_between(
-        yearly_stats["year"],
-        yearly_stats["temp_min"],
-        yearly_stats["temp_max"],
-        color=fill_color,
-        alpha=0.3,
-        label="Range tra Media Min/Max",
-    )
+        style, theme = {}, _LIGHT_STYLE
 
-    # Mean temp line
-    ax.plot(
-        yearly_stats["year"],
-        yearly_stats["temp_mean"],
-        color=line_color,
-        marker="o",
-        label="Temperatura Media Annuale",
-    )
+    with plt.style.context(style), matplotlib.rc_context({**_BASE_STYLE, **theme}):
+        owns_figure = fig is None
+        if owns_figure:
+            fig, ax = plt.subplots(figsize=(15, 8))
+        else:
+            # Reuse the caller's figure; fresh axes pick up this chart's theme
+            fig.clear()
+            fig.patch.set_facecolor(plt.rcParams["figure.facecolor"])
+            ax = fig.add_subplot()
+
+        if dark_theme:
+            # Set dark background colors explicitly
+            fig.patch.set_facecolor("black")
+            ax.set_facecolor("black")
+
+        # Fill range between min and max
+        if dark_theme:
+            fill_color = "steelblue"
+            line_color = "cyan"
+            grid_color = "gray"
+        else:
+            fill_color = "skyblue"
+            line_color = "royalblue"
+            grid_color = None
+
+        # Per-point artists; rasterized when saving to a vector format
+        data_artists = []
+
+        if has_range:
+            data_artists.append(
+                ax.fill_between(
+                    yearly_stats["year"],
+                    yearly_stats["temp_min"],
+                    yearly_stats["temp_max"],
+                    color=fill_color,
+                    alpha=0.3,
+                    label="Range tra Media Min/Max",
+                )
+            )
 
-    # Add trend line if requested
-    if show_trend:
-        years = yearly_stats["year"].values
-        temps = yearly_stats["temp_mean"].values
-
-        # Calculate linear regression
-        coeffs = np.polyfit(years, temps, 1)
-        trend_line = np.poly1d(coeffs)
-
-        trend_color = "orange" if dark_theme else "red"
-        ax.plot(
-            years,
-            trend_line(years),
-            color=trend_color,
-            linestyle="--",
-            linewidth=2,
-            label="Trend (Regressione Lineare)",
+        # Mean temp line
+        data_artists += ax.plot(
+            yearly_stats["year"],
+            yearly_stats["temp_mean"],
+            color=line_color,
+            marker="o",
+            label="Temperatura Media Annuale",
         )
 
-        # Add start and end points on the trend line
-        start_year = years[0]
-        end_year = years[-1]
-        start_temp = trend_line(start_year)
-        end_temp = trend_line(end_year)
-
-        # Plot trend start and end points
-        ax.plot(
-            [start_year, end_year],
-            [start_temp, end_temp],
-            color=trend_color,
-            marker="s",
-            markersize=8,
-            linestyle="None",
-            markeredgecolor="white" if dark_theme else "black",
-            markeredgewidth=1,
-            alpha=0.8,
-        )
+        # Add trend line if requested
+        if show_trend:
+            years = yearly_stats["year"].values
+            temps = yearly_stats["temp_mean"].values
+
+            # Calculate linear regression
+            slope, intercept = _linear_fit(years, temps)
+            trend_temps = slope * years + intercept
+
+            trend_color = "orange" if dark_theme else "red"
+            data_artists += ax.plot(
+                years,
+                trend_temps,
+                color=trend_color,
+                linestyle="--",
+                linewidth=2,
+                label="Trend (Regressione Lineare)",
+            )
 
-        # Add temperature annotations at start and end points
-        ax.annotate(
-            f"{start_temp:.1f}°C",
-            (start_year, start_temp),
-            xytext=(-6, -3.5),
-            textcoords="offset points",
-            fontsize=9,
-            color=trend_color,
-            weight="bold",
-            ha="right",
-        )
+            # Add start and end points on the trend line
+            start_year = years[0]
+            end_year = years[-1]
+            start_temp = trend_temps[0]
+            end_temp = trend_temps[-1]
+
+            # Plot trend start and end points
+            data_artists += ax.plot(
+                [start_year, end_year],
+                [start_temp, end_temp],
+                color=trend_color,
+                marker="s",
+                markersize=8,
+                linestyle="None",
+                markeredgecolor="white" if dark_theme else "black",
+                markeredgewidth=1,
+                alpha=0.8,
+            )
 
-        ax.annotate(
-            f"{end_temp:.1f}°C",
-            (end_year, end_temp),
-            xytext=(6, -3.5),
-            textcoords="offset points",
-            fontsize=9,
-            color=trend_color,
-            weight="bold",
-            ha="left",
-        )
+            # Add temperature annotations at start and end points
+            ax.annotate(
+                f"{start_temp:.1f}°C",
+                (start_year, start_temp),
+                xytext=(-6, -3.5),
+                textcoords="offset points",
+                fontproperties=_ANNOT_FP,
+                color=trend_color,
+                ha="right",
+            )
 
-        print(f"📊 Trend lineare: {coeffs[0]:.3f}°C per anno")
-        print(f"📍 Temperatura trend inizio ({start_year}): {start_temp:.1f}°C")
-        print(f"📍 Temperatura trend fine ({end_year}): {end_temp:.1f}°C")
+            ax.annotate(
+                f"{end_temp:.1f}°C",
+                (end_year, end_temp),
+                xytext=(6, -3.5),
+                textcoords="offset points",
+                fontproperties=_ANNOT_FP,
+                color=trend_color,
+                ha="left",
+            )
 
-    # Titles and labels
-    title_suffix = ""
-    if year is not None:
-        title_suffix = f" - Anno {year}"
-    elif year_range is not None:
-        title_suffix = f" - Anni {year_range[0]}-{year_range[1]}"
+            print(f"📊 Trend lineare: {slope:.3f}°C per anno")
+            print(f"📍 Temperatura trend inizio ({start_year}): {start_temp:.1f}°C")
+            print(f"📍 Temperatura trend fine ({end_year}): {end_temp:.1f}°C")
 
-    if month is not None:
-        month_name = pd.to_datetime(f"2000-{month:02d}-01").strftime("%B")
-        title_suffix += f" - {month_name}"
-    elif month_range is not None:
-        start_month_name = pd.to_datetime(f"2000-{month_range[0]:02d}-01").strftime(
-            "%B"
+        # Titles and labels
+        title_suffix, filename_suffix = _format_labels(
+            year,
+            tuple(year_range) if year_range is not None else None,
+            month,
+            tuple(month_range) if month_range is not None else None,
         )
-        end_month_name = pd.to_datetime(f"2000-{month_range[1]:02d}-01").strftime("%B")
-        title_suffix += f" - {start_month_name} a {end_month_name}"
-
-    ax.set_title(
-        f"Temperature Medie - {location_display}{title_suffix}",
-        fontsize=18,
-        fontweight="bold",
-        pad=20,
-        color="white" if dark_theme else "black",
-    )
-    ax.set_xlabel("Anno", fontsize=12, color="white" if dark_theme else "black")
-    ax.set_ylabel(
-        "Temperatura (°C)", fontsize=12, color="white" if dark_theme else "black"
-    )
 
-    # X ticks
-    ax.xaxis.set_major_locator(mticker.MaxNLocator(integer=True))
-    plt.xticks(rotation=45)
+        ax.set_title(
+            f"Temperature Medie - {meta.location_display}{title_suffix}",
+            fontproperties=_TITLE_FP,
+            pad=20,
+            color="white" if dark_theme else "black",
+        )
+        ax.set_xlabel(
+            "Anno", fontproperties=_AXIS_FP, color="white" if dark_theme else "black"
+        )
+        ax.set_ylabel(
+            "Temperatura (°C)",
+            fontproperties=_AXIS_FP,
+            color="white" if dark_theme else "black",
+        )
 
-    # Set tick colors for dark theme
-    if dark_theme:
-        ax.tick_params(colors="white")
+        # X ticks
+        ax.xaxis.set_major_locator(mticker.MaxNLocator(integer=True))
+        ax.tick_params(axis="x", labelrotation=45)
+
+        # Set tick colors for dark theme
+        if dark_theme:
+            ax.tick_params(colors="white")
+
+        ax.legend(fontsize=12)
+        grid_kwargs = {"linestyle": "--", "linewidth": 0.5}
+        if grid_color:
+            grid_kwargs["color"] = grid_color
+        ax.grid(True, **grid_kwargs)
+
+        # Add source information
+        fig.text(
+            0.99,
+            0.01,
+            meta.source_text,
+            fontproperties=_SOURCE_FP,
+            ha="right",
+            va="bottom",
+            alpha=0.7,
+        )
 
-    ax.legend(fontsize=12)
-    grid_kwargs = {"linestyle": "--", "linewidth": 0.5}
-    if grid_color:
-        grid_kwargs["color"] = grid_color
-    ax.grid(True, **grid_kwargs)
+        fig.tight_layout()
 
-    # Add source information
-    source_text = f"Fonte: {source_name}"
-    if source_info.get("website"):
-        source_text += f" ({source_info['website']})"
+        # Save to file
+        os.makedirs("img", exist_ok=True)
 
-    plt.figtext(
-        0.99,
-        0.01,
-        source_text,
-        fontsize=8,
-        ha="right",
-        va="bottom",
-        style="italic",
-        alpha=0.7,
-    )
+        if output_filename:
+            # Use custom filename
+            output_file = output_filename
+            # Ensure the custom filename has a supported extension (PNG by default)
+            if not output_file.endswith((".png",) + VECTOR_FORMATS):
+                output_file += ".png"
+            # Add img/ directory if just filename is provided
+            if "/" not in output_file:
+                output_file = f"img/{output_file}"
+        else:
+            # Use default filename pattern
+            output_file = (
+                f"img/weather_trend_{meta.location_coords}{filename_suffix}.png"
+            )
 
-    plt.tight_layout()
+        if output_file.endswith(VECTOR_FORMATS):
+            # Keep axes and text as vectors; only the data is rasterized
+            for artist in data_artists:
+                artist.set_rasterized(True)
+            fig.savefig(output_file, dpi=dpi, bbox_inches="tight")
+        else:
+            # zlib level 3 encodes several times faster than the default 6
+            fig.savefig(
+                output_file,
+                dpi=dpi,
+                bbox_inches="tight",
+                pil_kwargs={"compress_level": 3},
+            )
+        print(f"📈 Grafico salvato in: {output_file}")
 
-    # Save to file
-    os.makedirs("img", exist_ok=True)
+        if not no_display:
+            plt.show()
+        else:
+            print("📄 Grafico non visualizzato (--no-display attivo)")
+            if owns_figure:
+                plt.close(fig)  # Close the figure to free memory
 
-    if output_filename:
-        # Use custom filename
-        output_file = output_filename
-        # Ensure the custom filename has .png extension
-        if not output_file.endswith(".png"):
-            output_file += ".png"
-        # Add img/ directory if just filename is provided
-        if "/" not in output_file:
-            output_file = f"img/{output_file}"
-    else:
-        # Use default filename pattern
-        filename_suffix = ""
-        if year is not None:
-            filename_suffix += f"_year{year}"
-        elif year_range is not None:
-            filename_suffix += f"_years{year_range[0]}-{year_range[1]}"
-        if month is not None:
-            filename_suffix += f"_month{month:02d}"
-        elif month_range is not None:
-            filename_suffix += f"_months{month_range[0]:02d}-{month_range[1]:02d}"
-
-        output_file = f"img/weather_trend_{location_coords}{filename_suffix}.png"
-
-    plt.savefig(output_file, dpi=300, bbox_inches="tight")
-    print(f"📈 Grafico salvato in: {output_file}")
-
-    if not no_display:
-        plt.show()
-    else:
-        print("📄 Grafico non visualizzato (--no-display attivo)")
-        plt.close()  # Close the figure to free memory
 
+def visualize_many(jobs):
+    """
+    Render several charts on one shared figure, saving each without display.
 
-if __name__ == "__main__":
+    `jobs` is an iterable of `visualize_weather_data` keyword-argument dicts,
+    each including `filename`.
+    """
+    fig = plt.figure(figsize=(15, 8))
+    try:
+        for job in jobs:
+            visualize_weather_data(**{**job, "no_display": True, "fig": fig})
+    finally:
+        plt.close(fig)
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
     parser = argparse.ArgumentParser(
         description="Visualize weather data from Open-Meteo JSON files"
     )
@@ -418,7 +632,7 @@ if __name__ == "__main__":
         "-o",
         "--output",
         type=str,
-        help="Custom filename for the output chart (default: auto-generated based on filters)",
+        help="Custom filename for the output chart; .pdf and .svg save a vector chart (default: auto-generated PNG based on filters)",
     )
     parser.add_argument(
         "-n",
@@ -426,8 +640,34 @@ if __name__ == "__main__":
         action="store_true",
         help="Save chart without displaying it",
     )
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=150,
+        help="Resolution of the saved chart in dots per inch (default: 150)",
+    )
+
+    return parser.parse_args()
+
+
+def visualization_kwargs(args):
+    """Map parsed CLI arguments to `visualize_weather_data` keyword arguments."""
+    return {
+        "year": args.year,
+        # Convert to tuples for easier handling
+        "year_range": tuple(args.year_range) if args.year_range else None,
+        "month": args.month,
+        "month_range": tuple(args.month_range) if args.month_range else None,
+        "dark_theme": args.dark,
+        "show_trend": args.trend,
+        "output_filename": args.output,
+        "no_display": args.no_display,
+        "dpi": args.dpi,
+    }
 
-    args = parser.parse_args()
+
+def main():
+    args = parse_arguments()
 
     # Validate arguments
     if args.year and args.year_range:
@@ -450,18 +690,12 @@ if __name__ == "__main__":
             print("❌ Start year must be less than or equal to end year")
             exit(1)
 
-    # Convert to tuples for easier handling
-    year_range = tuple(args.year_range) if args.year_range else None
-    month_range = tuple(args.month_range) if args.month_range else None
-
-    visualize_weather_data(
-        args.filename,
-        year=args.year,
-        year_range=year_range,
-        month=args.month,
-        month_range=month_range,
-        dark_theme=args.dark,
-        show_trend=args.trend,
-        output_filename=args.output,
-        no_display=args.no_display,
-    )
+    if args.dpi <= 0:
+        print("❌ DPI must be a positive number")
+        exit(1)
+
+    visualize_weather_data(args.filename, **visualization_kwargs(args))
+
+
+if __name__ == "__main__":
+    main()